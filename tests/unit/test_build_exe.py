@@ -0,0 +1,81 @@
+"""
+Unit tests for the startup measurement helpers in build_exe.py
+"""
+import argparse
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import build_exe
+
+# Captured from `python -X importtime -c "import json"` (CPython 3.11)
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       183 |        183 |       copyreg
+import time:       473 |       8824 |     re
+import time:       173 |        173 |       _json
+import time:       446 |        618 |     json.scanner
+import time:       392 |       9833 |   json.decoder
+import time:       462 |        462 |   json.encoder
+import time:       223 |      10517 | json
+"""
+
+
+def test_parse_importtime_skips_header_and_reads_columns():
+    modules = build_exe.parse_importtime(IMPORTTIME_SAMPLE)
+
+    assert [m['module'] for m in modules] == [
+        'copyreg', 're', '_json', 'json.scanner', 'json.decoder', 'json.encoder', 'json',
+    ]
+    json_mod = modules[-1]
+    assert json_mod['self_ms'] == pytest.approx(0.223)
+    assert json_mod['cumulative_ms'] == pytest.approx(10.517)
+
+
+def test_parse_importtime_depths():
+    depths = {m['module']: m['depth'] for m in build_exe.parse_importtime(IMPORTTIME_SAMPLE)}
+
+    assert depths['json'] == 0
+    assert depths['json.decoder'] == 1
+    assert depths['json.encoder'] == 1
+    assert depths['re'] == 2
+    assert depths['json.scanner'] == 2
+    assert depths['copyreg'] == 3
+
+
+def test_parse_importtime_ignores_other_output():
+    assert build_exe.parse_importtime("usage: cli.py [-h]\nTraceback (most recent call last):\n") == []
+
+
+def test_positive_int():
+    assert build_exe.positive_int('3') == 3
+    with pytest.raises(argparse.ArgumentTypeError):
+        build_exe.positive_int('0')
+    with pytest.raises(argparse.ArgumentTypeError):
+        build_exe.positive_int('-1')
+
+
+def test_artifact_size_counts_whole_onedir_bundle(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_exe, 'dist_path', str(tmp_path))
+    bundle = tmp_path / build_exe.app_name
+    (bundle / '_internal').mkdir(parents=True)
+    launcher = bundle / 'launcher'
+    launcher.write_bytes(b'x' * 10)
+    (bundle / '_internal' / 'python.dll').write_bytes(b'x' * 1000)
+
+    assert build_exe.artifact_size('onedir', str(launcher)) == 1010
+    assert build_exe.artifact_size('onefile', str(launcher)) == 10
+
+
+def test_measure_startup_records_missing_artifact(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_exe, 'dist_path', str(tmp_path / 'dist'))
+    monkeypatch.setattr(build_exe, 'import_breakdown', lambda: {'error': 'skipped'})
+
+    report = build_exe.measure_startup('onefile', str(tmp_path / 'missing.exe'), runs=1)
+
+    assert 'error' in report
+    assert 'help_first_s' not in report
+    assert os.path.isfile(tmp_path / 'dist' / 'startup_onefile.json')